@@ -54,3 +54,24 @@ def create_kml_content(photos: list, trip_name: str) -> str:
 {chr(10).join(placemarks)}
   </Document>
 </kml>'''
+
+def create_index_kml(trips: list, index_name: str) -> str:
+    """Generates an index KML that network-links each trip KMZ by relative path."""
+    links = []
+    for trip in trips:
+        links.append(f'''    <NetworkLink>
+      <name>{html.escape(trip["name"])}</name>
+      <description>{trip["count"]} photos</description>
+      <visibility>1</visibility>
+      <Link>
+        <href>{html.escape(trip["href"])}</href>
+      </Link>
+    </NetworkLink>''')
+
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+  <Document>
+    <name>{html.escape(index_name)}</name>
+{chr(10).join(links)}
+  </Document>
+</kml>'''
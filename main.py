@@ -7,11 +7,12 @@ BeenThereSnappedThat - Generate KMZ trip maps from geotagged photos.
 import os
 from pathlib import Path
 from tqdm import tqdm
-from user_interface import ask_for_folder, configure_smoothing
+from user_interface import ask_for_folder, configure_smoothing, configure_segmentation
 from exif_utils import get_exif_data, get_capture_time, get_gps_info, standardize_coordinates
 from gps_smoother import smooth_gps_track
-from kml_generator import create_kml_content
-from kmz_creator import save_kmz_file
+from trip_segmenter import segment_track, segment_names
+from kml_generator import create_kml_content, create_index_kml
+from kmz_creator import save_kmz_files
 
 def main():
     """Main function to run the script."""
@@ -55,28 +56,52 @@ def main():
     photos.sort(key=lambda x: x['time'])
     print(f"\nFound {len(photos)} geotagged photos.")
 
-    # Configure and apply GPS smoothing
+    # Configure GPS smoothing and trip segmentation
     speed_enabled, max_speed_kmh, geo_enabled, geo_factor, ocean_enabled, ocean_max_direct_km = configure_smoothing()
-    photos = smooth_gps_track(
-        photos, speed_enabled, max_speed_kmh, geo_enabled, geo_factor, 
-        geo_min_direct_km=0.1, ocean_enabled=ocean_enabled, 
+    smoothing = dict(
+        speed_enabled=speed_enabled, max_speed_kmh=max_speed_kmh, geo_enabled=geo_enabled,
+        geo_detour_factor=geo_factor, geo_min_direct_km=0.1, ocean_enabled=ocean_enabled,
         ocean_max_direct_km=ocean_max_direct_km, max_passes=5
     )
+    segment_enabled, max_gap_hours, max_jump_km, split_by_day, max_photos = configure_segmentation()
 
-    if not photos:
-        print("No valid photos remaining after GPS smoothing.")
-        return
+    print("\n" + "=" * 60)
+    print("Configuration complete. Starting processing...".center(60))
+    print("=" * 60 + "\n")
+
+    segments = segment_track(photos, max_gap_hours, max_jump_km, split_by_day, max_photos) if segment_enabled else [photos]
+    names = segment_names(segments)
+
+    # Smooth each trip on its own so corrections never interpolate across trips
+    trips = []
+    for segment, name in zip(segments, names):
+        if len(segments) > 1:
+            print(f"\nSmoothing {name} ({len(segment)} photos)...")
+        trips.append((name, smooth_gps_track(segment, **smoothing)))
 
-    trip_date = photos[0]['time'].strftime('%Y-%m-%d')
-    save_path = Path(__file__).parent / f"trip_{trip_date}.kmz"
+    # Export all trips in parallel through one shared image resize pool
+    saved_paths = [Path(__file__).parent / f"{name}.kmz" for name, _ in trips]
+    save_kmz_files([
+        (create_kml_content(trip_photos, f"BeenThereSnappedThat - {name.removeprefix('trip_')}"), trip_photos, path)
+        for (name, trip_photos), path in zip(trips, saved_paths)
+    ])
 
-    kml = create_kml_content(photos, f"BeenThereSnappedThat - {trip_date}")
-    save_kmz_file(kml, photos, save_path)
+    # Plain KML so the relative links resolve next to the index, not inside an archive
+    if len(trips) > 1:
+        index_path = Path(__file__).parent / f"trip_index_{trips[0][1][0]['time'].strftime('%Y-%m-%d')}.kml"
+        index_kml = create_index_kml(
+            [{'name': name, 'href': path.name, 'count': len(trip_photos)}
+             for (name, trip_photos), path in zip(trips, saved_paths)],
+            f"BeenThereSnappedThat - {len(trips)} trips"
+        )
+        index_path.write_text(index_kml, encoding='utf-8')
+        saved_paths.append(index_path)
 
     print("\n" + "=" * 60)
-    print("KMZ file created successfully!".center(60))
-    print(f"Saved to: {save_path}".center(60))
-    print("You can open this file in Google Earth.".center(60))
+    print(f"{len(saved_paths)} file(s) created successfully!".center(60))
+    for path in saved_paths:
+        print(f"Saved to: {path}".center(60))
+    print("You can open these files in Google Earth.".center(60))
     print("=" * 60)
 
 if __name__ == "__main__":
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for KML generation.
+"""
+
+from kml_generator import create_index_kml
+
+def test_index_kml_links_each_trip():
+    kml = create_index_kml(
+        [{'name': 'trip_2024-01-01', 'href': 'trip_2024-01-01.kmz', 'count': 12},
+         {'name': 'trip_2024-01-02', 'href': 'trip_2024-01-02.kmz', 'count': 3}],
+        "BeenThereSnappedThat - 2 trips"
+    )
+    assert kml.count('<NetworkLink>') == 2
+    assert '<href>trip_2024-01-01.kmz</href>' in kml
+    assert '<description>12 photos</description>' in kml
+    assert '<description>3 photos</description>' in kml
+
+def test_index_kml_escapes_names():
+    kml = create_index_kml([{'name': 'Tom & Jerry <3', 'href': 'a&b.kmz', 'count': 1}], 'Trips & more')
+    assert '<name>Tom &amp; Jerry &lt;3</name>' in kml
+    assert '<href>a&amp;b.kmz</href>' in kml
+    assert '<name>Trips &amp; more</name>' in kml
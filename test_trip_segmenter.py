@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for trip segmentation and naming.
+"""
+
+from datetime import datetime, timedelta
+from gps_smoother import haversine, smooth_gps_track
+from trip_segmenter import segment_track, segment_names
+
+START = datetime(2024, 1, 1, 8, 0, 0)
+
+def make_photos(points):
+    """Builds photo dicts from (hours after START, lat, lon) tuples."""
+    return [{'path': f"img_{i}.jpg", 'time': START + timedelta(hours=h), 'lat': lat, 'lon': lon,
+             'corrected': False, 'corrected_reason': ''}
+            for i, (h, lat, lon) in enumerate(points)]
+
+def sizes(segments):
+    return [len(s) for s in segments]
+
+def test_empty_track():
+    assert segment_track([]) == []
+
+def test_splits_on_time_gap():
+    photos = make_photos([(0, 32.0, 35.0), (1, 32.01, 35.0), (14, 32.02, 35.0)])
+    assert sizes(segment_track(photos, max_gap_hours=12)) == [2, 1]
+
+def test_gap_equal_to_threshold_does_not_split():
+    photos = make_photos([(0, 32.0, 35.0), (12, 32.01, 35.0)])
+    assert sizes(segment_track(photos, max_gap_hours=12)) == [2]
+
+def test_splits_on_confirmed_distance_jump():
+    photos = make_photos([(0, 32.0, 35.0), (1, 32.01, 35.0), (2, 37.0, 35.0), (3, 37.01, 35.0)])
+    assert sizes(segment_track(photos, max_jump_km=200)) == [2, 2]
+
+def test_single_glitch_stays_in_track_and_is_smoothed():
+    # The third photo is about 555 km away from the others
+    photos = make_photos([(0, 32.0, 35.0), (1, 32.01, 35.0), (2, 37.0, 35.0), (3, 32.03, 35.0)])
+    segments = segment_track(photos, max_jump_km=200)
+    assert sizes(segments) == [4]
+    assert segment_names(segments) == ['trip_2024-01-01']
+
+    smoothed = smooth_gps_track(segments[0])
+    assert smoothed[2]['corrected']
+    assert haversine(smoothed[2]['lat'], smoothed[2]['lon'], 32.0, 35.0) < 200
+
+def test_splits_per_calendar_day():
+    photos = make_photos([(0, 32.0, 35.0), (10, 32.0, 35.0), (17, 32.0, 35.0), (40, 32.0, 35.0)])
+    assert sizes(segment_track(photos, split_by_day=True)) == [2, 1, 1]
+
+def test_names_without_duplicates():
+    photos = make_photos([(0, 32.0, 35.0), (24, 32.0, 35.0)])
+    assert segment_names([[p] for p in photos]) == ['trip_2024-01-01', 'trip_2024-01-02']
+
+def test_names_number_trips_sharing_a_date():
+    photos = make_photos([(0, 32.0, 35.0), (5, 32.0, 35.0), (24, 32.0, 35.0)])
+    assert segment_names([[p] for p in photos]) == ['trip_2024-01-01_1', 'trip_2024-01-01_2', 'trip_2024-01-02']
+
+def test_far_last_photo_starts_new_trip():
+    photos = make_photos([(0, 32.0, 35.0), (1, 32.01, 35.0), (3, 37.0, 35.0)])
+    segments = segment_track(photos, max_jump_km=200)
+    assert sizes(segments) == [2, 1]
+
+    smoothed = smooth_gps_track(segments[0])
+    assert not any(p['corrected'] for p in smoothed)
+
+def test_far_photo_followed_by_gap_starts_new_trip():
+    photos = make_photos([(0, 32.0, 35.0), (1, 32.01, 35.0), (3, 37.0, 35.0), (27, 32.02, 35.0)])
+    segments = segment_track(photos, max_gap_hours=12, max_jump_km=200)
+    assert sizes(segments) == [2, 1, 1]
+
+    smoothed = smooth_gps_track(segments[0])
+    assert smoothed[1]['lat'] == 32.01
+
+def test_splits_large_trip_at_largest_gap():
+    # Hourly photos with one 5 hour pause after the sixth photo
+    photos = make_photos([(h if h < 6 else h + 4, 32.0, 35.0) for h in range(10)])
+    assert sizes(segment_track(photos, max_photos=8)) == [6, 4]
+
+def test_large_trip_parts_stay_within_limit():
+    photos = make_photos([(h, 32.0, 35.0) for h in range(210)])
+    segments = segment_track(photos, max_gap_hours=12, max_photos=50)
+    assert all(len(s) <= 50 for s in segments)
+    assert [p for s in segments for p in s] == photos
+
+def test_no_photo_limit():
+    photos = make_photos([(h, 32.0, 35.0) for h in range(210)])
+    assert sizes(segment_track(photos, max_photos=None)) == [210]
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+Splits a time-sorted photo track into separate trips.
+"""
+
+from collections import Counter
+from gps_smoother import haversine
+
+DEFAULT_MAX_GAP_HOURS = 12.0
+DEFAULT_MAX_JUMP_KM = 200.0
+DEFAULT_MAX_PHOTOS_PER_TRIP = 100
+
+def segment_track(
+    photos: list,
+    max_gap_hours: float = DEFAULT_MAX_GAP_HOURS,
+    max_jump_km: float = DEFAULT_MAX_JUMP_KM,
+    split_by_day: bool = False,
+    max_photos: int | None = DEFAULT_MAX_PHOTOS_PER_TRIP
+) -> list[list]:
+    """Splits a time-sorted track on time gaps, distance jumps, or calendar days.
+
+    A distance jump is ignored when the next photo follows shortly and is back near the track,
+    so single-photo GPS glitches stay in the trip for smoothing to correct. Trips with more than
+    `max_photos` photos are further split at their largest time gaps.
+    """
+    if not photos:
+        return []
+
+    segments = [[photos[0]]]
+    anchor = photos[0]  # Last photo not treated as a possible glitch
+
+    for i in range(1, len(photos)):
+        prev_p, curr_p = photos[i - 1], photos[i]
+        next_p = photos[i + 1] if i + 1 < len(photos) else None
+
+        if split_by_day:
+            new_segment = curr_p['time'].date() != prev_p['time'].date()
+        else:
+            gap_hours = (curr_p['time'] - prev_p['time']).total_seconds() / 3600
+            new_segment = gap_hours > max_gap_hours
+
+            if not new_segment and haversine(anchor['lat'], anchor['lon'], curr_p['lat'], curr_p['lon']) > max_jump_km:
+                is_glitch = (
+                    next_p is not None
+                    and (next_p['time'] - curr_p['time']).total_seconds() / 3600 <= max_gap_hours
+                    and haversine(anchor['lat'], anchor['lon'], next_p['lat'], next_p['lon']) <= max_jump_km
+                )
+                if is_glitch:
+                    segments[-1].append(curr_p)
+                    continue
+                new_segment = True
+
+        if new_segment:
+            segments.append([curr_p])
+        else:
+            segments[-1].append(curr_p)
+        anchor = curr_p
+
+    if max_photos:
+        segments = [part for seg in segments for part in _split_large_segment(seg, max_photos)]
+    return segments
+
+def _split_large_segment(segment: list, max_photos: int) -> list[list]:
+    """Splits a segment at its largest time gaps until no part exceeds max_photos."""
+    parts, pending = [], [segment]
+    while pending:
+        part = pending.pop()
+        if len(part) <= max_photos:
+            parts.append(part)
+            continue
+
+        # Prefer the largest gap, breaking ties towards the middle of the segment
+        split_at = max(range(1, len(part)),
+                       key=lambda i: (part[i]['time'] - part[i - 1]['time'], -abs(2 * i - len(part))))
+        pending += [part[split_at:], part[:split_at]]
+    return parts
+
+def segment_names(segments: list[list]) -> list[str]:
+    """Generates unique 'trip_YYYY-MM-DD[_N]' names, numbering segments that share a start date."""
+    dates = [seg[0]['time'].strftime('%Y-%m-%d') for seg in segments]
+    totals, seen = Counter(dates), Counter()
+
+    names = []
+    for date in dates:
+        seen[date] += 1
+        suffix = f"_{seen[date]}" if totals[date] > 1 else ""
+        names.append(f"trip_{date}{suffix}")
+    return names
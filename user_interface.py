@@ -10,6 +10,7 @@ from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from InquirerPy.separator import Separator
 from gps_smoother import HAS_LAND_MASK
+from trip_segmenter import DEFAULT_MAX_GAP_HOURS, DEFAULT_MAX_JUMP_KM, DEFAULT_MAX_PHOTOS_PER_TRIP
 
 def validate_range(min_val, max_val, type_func=float):
     """Creates a validator for numeric ranges."""
@@ -112,8 +113,73 @@ def configure_smoothing() -> tuple[bool, float, bool, float, bool, float]:
             filter=float,
         ).execute()
 
+    return (speed_enabled, max_speed_kmh, geo_enabled, geo_factor, ocean_enabled, ocean_max_direct_km)
+
+def configure_segmentation() -> tuple[bool, float, float, bool, int]:
+    """Guides the user through configuring how the photos are split into trips."""
     print("\n" + "=" * 60)
-    print("Configuration complete. Starting processing...".center(60))
+    print("BeenThereSnappedThat - Trip Segmentation".center(60))
     print("=" * 60 + "\n")
 
-    return (speed_enabled, max_speed_kmh, geo_enabled, geo_factor, ocean_enabled, ocean_max_direct_km)
+    while True:
+        mode = inquirer.select(
+            message="How should photos be split into trips?",
+            choices=[
+                Choice("auto", name="Split on time gaps and distance jumps (Recommended)"),
+                Choice("day", name="One trip per calendar day"),
+                Choice("none", name="Single trip (no splitting)"),
+                Separator(),
+                Choice("help", name="Help: Explain these methods"),
+            ],
+            default="auto",
+        ).execute()
+
+        if mode == "help":
+            print("\n" + "-" * 70)
+            print("Trip Segmentation Methods Explained".center(70))
+            print("-" * 70)
+            print("Split on time gaps and distance jumps:")
+            print(f"  - Starts a new trip after a pause between photos (default: {DEFAULT_MAX_GAP_HOURS:g} hours).")
+            print(f"  - Also starts one after a large jump between photos (default: {DEFAULT_MAX_JUMP_KM:g} km).")
+            print("  - A single photo that jumps away and back is treated as a GPS glitch.\n")
+            print("One trip per calendar day:")
+            print("  - Creates a separate trip for each day with photos.\n")
+            print("Single trip:")
+            print("  - Keeps the whole folder as one trip, like older versions.\n")
+            print("Trips with more photos than the configured maximum are split at their largest time gaps.")
+            print("-" * 70)
+            input("\nPress Enter to return to selection...")
+            continue
+
+        break # Exit loop if help was not selected
+
+    max_gap_hours = DEFAULT_MAX_GAP_HOURS
+    max_jump_km = DEFAULT_MAX_JUMP_KM
+    if mode == "auto":
+        max_gap_hours = inquirer.text(
+            message="Start a new trip after a gap of (hours):",
+            default=f"{DEFAULT_MAX_GAP_HOURS:g}",
+            validate=validate_range(1, 720),
+            invalid_message="Enter a number between 1 and 720",
+            filter=float,
+        ).execute()
+
+        max_jump_km = inquirer.text(
+            message="Start a new trip after a jump between photos of (km):",
+            default=f"{DEFAULT_MAX_JUMP_KM:g}",
+            validate=validate_range(10, 20000),
+            invalid_message="Enter a number between 10 and 20000",
+            filter=float,
+        ).execute()
+
+    max_photos = DEFAULT_MAX_PHOTOS_PER_TRIP
+    if mode != "none":
+        max_photos = inquirer.text(
+            message="Maximum photos per trip:",
+            default=str(DEFAULT_MAX_PHOTOS_PER_TRIP),
+            validate=validate_range(10, 10000, int),
+            invalid_message="Enter a whole number between 10 and 10000",
+            filter=int,
+        ).execute()
+
+    return (mode != "none", max_gap_hours, max_jump_km, mode == "day", max_photos)